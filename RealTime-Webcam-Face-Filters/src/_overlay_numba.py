@@ -0,0 +1,44 @@
+"""
+Optional Numba-accelerated alpha blending kernel for the overlay filters.
+
+Numba is not a required dependency; when it is not installed the filters in
+face_filters fall back to the vectorized NumPy blend. When it is available,
+the JIT kernel performs the (src * a + dst * (255 - a)) >> 8 blend with the
+row loop parallelized across cores and the inner loop autovectorized.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def blend_bgra_over_bgr(roi, overlay_roi):
+        """
+        Alpha-blend a BGRA overlay onto a BGR region of interest in place.
+
+        Args:
+            roi (numpy.ndarray): The uint8 BGR region of the frame.
+            overlay_roi (numpy.ndarray): The uint8 BGRA overlay of the same
+                height and width.
+        """
+        height, width = overlay_roi.shape[:2]
+        for i in prange(height):
+            for j in range(width):
+                alpha = overlay_roi[i, j, 3]
+                inv_alpha = 255 - alpha
+                for c in range(3):
+                    roi[i, j, c] = np.uint8(
+                        (overlay_roi[i, j, c] * alpha + roi[i, j, c] * inv_alpha)
+                        >> 8
+                    )
+
+else:
+    blend_bgra_over_bgr = None
@@ -1,213 +1,459 @@
-import cv2
-import numpy as np
-from src.webcam_constants import (
-    BLUR_KERNEL_SIZE,
-    SUNGLASSES_IMAGE_PATH,
-    MUSTACHE_IMAGE_PATH,
-)
-
-
-def apply_blur_filter(frame, landmarks):
-    """
-    Apply a blur filter to the face using the detected landmarks.
-
-    Args:
-        frame (numpy.ndarray): The frame from the webcam capture.
-        landmarks (list): A list of facial landmarks.
-
-    Returns:
-        frame (numpy.ndarray): The frame with the face blurred.
-    """
-    if not landmarks:
-        return frame
-
-    # Create a mask for the face
-    mask = np.zeros(frame.shape[:2], dtype=np.uint8)
-    for face_landmarks in landmarks:
-        hull = cv2.convexHull(np.array(face_landmarks))
-        cv2.fillConvexPoly(mask, hull, 255)
-
-    # Apply the blur to the face region
-    blurred_frame = cv2.GaussianBlur(frame, BLUR_KERNEL_SIZE, 0)
-    frame = np.where(mask[:, :, np.newaxis] == 255, blurred_frame, frame)
-
-    return frame
-
-
-def apply_sunglasses_filter(frame, landmarks):
-    """
-    Apply a sunglasses filter to the face using the detected landmarks.
-
-    Args:
-        frame (numpy.ndarray): The frame from the webcam capture.
-        landmarks (list): A list of facial landmarks.
-
-    Returns:
-        frame (numpy.ndarray): The frame with the sunglasses filter applied.
-    """
-    if not landmarks:
-        return frame
-
-    # Load the sunglasses image
-    sunglasses = cv2.imread(SUNGLASSES_IMAGE_PATH, cv2.IMREAD_UNCHANGED)
-    if sunglasses is None:
-        print(f"Error: Unable to load sunglasses image from {SUNGLASSES_IMAGE_PATH}")
-        return frame
-
-    for face_landmarks in landmarks:
-        # Get the coordinates for the eyes
-        left_eye = face_landmarks[33]  # Left eye corner
-        right_eye = face_landmarks[263]  # Right eye corner
-
-        # Calculate the width and height of the sunglasses
-        eye_width = int(np.linalg.norm(np.array(right_eye) - np.array(left_eye)))
-        sunglasses_width = int(
-            eye_width * 2.2
-        )  # Adjust the multiplier for a better fit
-        aspect_ratio = sunglasses.shape[0] / sunglasses.shape[1]
-        sunglasses_height = int(sunglasses_width * aspect_ratio)
-
-        # Resize the sunglasses image
-        resized_sunglasses = cv2.resize(
-            sunglasses,
-            (sunglasses_width, sunglasses_height),
-            interpolation=cv2.INTER_AREA,
-        )
-
-        # Calculate the angle between the eyes (invert the sign for correct direction)
-        eye_delta_x = right_eye[0] - left_eye[0]
-        eye_delta_y = right_eye[1] - left_eye[1]
-        angle = -np.degrees(np.arctan2(eye_delta_y, eye_delta_x))  # Inverted sign
-
-        # Rotate the sunglasses image
-        M = cv2.getRotationMatrix2D(
-            (sunglasses_width // 2, sunglasses_height // 2), angle, 1.0
-        )
-        rotated_sunglasses = cv2.warpAffine(
-            resized_sunglasses,
-            M,
-            (sunglasses_width, sunglasses_height),
-            flags=cv2.INTER_LINEAR,
-            borderMode=cv2.BORDER_REPLICATE,
-        )
-
-        # Calculate the position to overlay the sunglasses
-        center = np.mean([left_eye, right_eye], axis=0).astype(int)
-        top_left = (
-            int(center[0] - sunglasses_width / 2),
-            int(center[1] - sunglasses_height / 2),
-        )
-
-        # Ensure the coordinates are within the frame bounds
-        top_left_y = max(0, top_left[1])
-        bottom_right_y = min(frame.shape[0], top_left[1] + sunglasses_height)
-        top_left_x = max(0, top_left[0])
-        bottom_right_x = min(frame.shape[1], top_left[0] + sunglasses_width)
-
-        # Adjust the region of interest (ROI) in the frame
-        roi = frame[top_left_y:bottom_right_y, top_left_x:bottom_right_x]
-        sunglasses_roi = rotated_sunglasses[
-            top_left_y - top_left[1] : bottom_right_y - top_left[1],
-            top_left_x - top_left[0] : bottom_right_x - top_left[0],
-        ]
-
-        # Overlay the sunglasses on the frame
-        for i in range(sunglasses_roi.shape[0]):
-            for j in range(sunglasses_roi.shape[1]):
-                if sunglasses_roi[i, j, 3] > 0:  # Alpha channel check
-                    roi[i, j] = sunglasses_roi[i, j, :3]
-
-    return frame
-
-
-def apply_mustache_filter(frame, landmarks):
-    """
-    Apply a mustache filter to the face using the detected landmarks.
-
-    Args:
-        frame (numpy.ndarray): The frame from the webcam capture.
-        landmarks (list): A list of facial landmarks.
-
-    Returns:
-        frame (numpy.ndarray): The frame with the mustache filter applied.
-    """
-    if not landmarks:
-        return frame
-
-    # Load the mustache image
-    mustache = cv2.imread(MUSTACHE_IMAGE_PATH, cv2.IMREAD_UNCHANGED)
-    if mustache is None:
-        print(f"Error: Unable to load mustache image from {MUSTACHE_IMAGE_PATH}")
-        return frame
-
-    for face_landmarks in landmarks:
-        # Get the coordinates for the nose and upper lip
-        nose_tip = face_landmarks[1]  # Nose tip
-        left_mouth_corner = face_landmarks[61]  # Left mouth corner
-        right_mouth_corner = face_landmarks[291]  # Right mouth corner
-
-        # Calculate the width and height of the mustache
-        mouth_width = int(
-            np.linalg.norm(np.array(right_mouth_corner) - np.array(left_mouth_corner))
-        )
-        mustache_width = int(
-            mouth_width * 1.5
-        )  # Adjust the multiplier for a better fit
-        aspect_ratio = mustache.shape[0] / mustache.shape[1]
-        mustache_height = int(mustache_width * aspect_ratio)
-
-        # Resize the mustache image
-        resized_mustache = cv2.resize(
-            mustache,
-            (mustache_width, mustache_height),
-            interpolation=cv2.INTER_AREA,
-        )
-
-        # Calculate the angle between the mouth corners
-        mouth_delta_x = right_mouth_corner[0] - left_mouth_corner[0]
-        mouth_delta_y = right_mouth_corner[1] - left_mouth_corner[1]
-        angle = -np.degrees(np.arctan2(mouth_delta_y, mouth_delta_x))
-
-        # Rotate the mustache image
-        M = cv2.getRotationMatrix2D(
-            (mustache_width // 2, mustache_height // 2), angle, 1.0
-        )
-        rotated_mustache = cv2.warpAffine(
-            resized_mustache,
-            M,
-            (mustache_width, mustache_height),
-            flags=cv2.INTER_LINEAR,
-            borderMode=cv2.BORDER_REPLICATE,
-        )
-
-        # Calculate the position to overlay the mustache
-        center = np.mean(
-            [nose_tip, left_mouth_corner, right_mouth_corner], axis=0
-        ).astype(int)
-        top_left = (
-            int(center[0] - mustache_width / 2),
-            int(
-                nose_tip[1] - mustache_height * 0.2
-            ),  # Adjust vertical position to move the mustache up
-        )
-
-        # Ensure the coordinates are within the frame bounds
-        top_left_y = max(0, top_left[1])
-        bottom_right_y = min(frame.shape[0], top_left[1] + mustache_height)
-        top_left_x = max(0, top_left[0])
-        bottom_right_x = min(frame.shape[1], top_left[0] + mustache_width)
-
-        # Adjust the region of interest (ROI) in the frame
-        roi = frame[top_left_y:bottom_right_y, top_left_x:bottom_right_x]
-        mustache_roi = rotated_mustache[
-            top_left_y - top_left[1] : bottom_right_y - top_left[1],
-            top_left_x - top_left[0] : bottom_right_x - top_left[0],
-        ]
-
-        # Overlay the mustache on the frame
-        for i in range(mustache_roi.shape[0]):
-            for j in range(mustache_roi.shape[1]):
-                if mustache_roi[i, j, 3] > 0:  # Alpha channel check
-                    roi[i, j] = mustache_roi[i, j, :3]
-
-    return frame
+import functools
+
+import cv2
+import numpy as np
+from src.webcam_constants import (
+    BLUR_KERNEL_SIZE,
+    BLUR_PYRAMID_LEVELS,
+    FACE_OVAL_IDX,
+    SUNGLASSES_IMAGE_PATH,
+    MUSTACHE_IMAGE_PATH,
+    SUNGLASSES_IMG,
+    MUSTACHE_IMG,
+)
+from src._overlay_numba import blend_bgra_over_bgr
+
+
+# Width bin (in pixels) used to quantize overlay sizes so that tiny frame-to-
+# frame pose changes hit the render cache instead of re-running resize + warp
+_OVERLAY_WIDTH_BIN = 2
+
+# Render overlays on the GPU when OpenCV was built with CUDA and a device is
+# present; plain builds either lack the attribute or report zero devices
+try:
+    _CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):
+    _CUDA_AVAILABLE = False
+
+# Overlay assets uploaded to the GPU once, keyed like _overlay_assets
+_gpu_assets = {}
+
+# Route the blur pyramid through the OpenCV transparent API (UMat) when an
+# OpenCL device is usable, so pyrDown/pyrUp run on the OpenCL device; the
+# masked composite still needs NumPy indexing, so the result is downloaded
+try:
+    _OPENCL_AVAILABLE = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+except AttributeError:
+    _OPENCL_AVAILABLE = False
+
+# Registry mapping id(asset) -> asset so the cached renderer can be keyed by a
+# hashable value while still supporting arbitrary BGRA overlay images
+_overlay_assets = {}
+
+
+class _FilterScratch:
+    """
+    Reusable scratch buffers for the per-frame filter work.
+
+    Hands out named buffer views that are reallocated only when a request
+    outgrows the existing buffer, so steady-state frames do no heap
+    allocation for masks and blend temporaries. Not thread-safe; the filters
+    all run on the render thread.
+    """
+
+    def __init__(self):
+        self._buffers = {}
+
+    def get(self, name, shape, dtype):
+        """
+        Return a scratch view of the requested shape and dtype.
+
+        Args:
+            name (str): The buffer name; each name is one reusable buffer.
+            shape (tuple): The requested view shape.
+            dtype (numpy.dtype): The requested element type.
+
+        Returns:
+            view (numpy.ndarray): A view of the named buffer; contents are
+                unspecified, so callers must fill or overwrite it.
+        """
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+        elif any(have < need for have, need in zip(buffer.shape, shape)):
+            grown = tuple(max(have, need) for have, need in zip(buffer.shape, shape))
+            buffer = np.empty(grown, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer[tuple(slice(0, n) for n in shape)]
+
+
+_scratch = _FilterScratch()
+
+
+def _overlay_matrix(asset_width, asset_height, width, height, angle):
+    """
+    Compose the scale and rotation of an overlay into one affine matrix.
+
+    Maps the asset center to the center of a width x height canvas while
+    scaling to the target width and rotating, so the asset is resampled once
+    instead of through separate resize and rotate passes.
+
+    Args:
+        asset_width (int): The source asset width in pixels.
+        asset_height (int): The source asset height in pixels.
+        width (int): The target overlay width in pixels.
+        height (int): The target overlay height in pixels.
+        angle (int): The rotation angle in whole degrees.
+
+    Returns:
+        M (numpy.ndarray): The 2x3 affine matrix for the fused transform.
+    """
+    scale = width / asset_width
+    M = cv2.getRotationMatrix2D((asset_width / 2, asset_height / 2), angle, scale)
+    M[0, 2] += width / 2 - asset_width / 2
+    M[1, 2] += height / 2 - asset_height / 2
+    return M
+
+
+@functools.lru_cache(maxsize=64)
+def _overlay_maps(asset_width, asset_height, width, height, angle):
+    """
+    Build fixed-point remap tables for the fused scale-plus-rotate transform.
+
+    cv2.remap with prebuilt 16SC2 maps skips the per-pixel matrix multiply
+    that cv2.warpAffine performs, and the maps are shared by every overlay
+    rendered from the same asset size at the same quantized pose.
+
+    Args:
+        asset_width (int): The source asset width in pixels.
+        asset_height (int): The source asset height in pixels.
+        width (int): The overlay width in pixels.
+        height (int): The overlay height in pixels.
+        angle (int): The rotation angle in whole degrees.
+
+    Returns:
+        maps (tuple): The (map1, map2) pair for cv2.remap in CV_16SC2 format.
+    """
+    M = _overlay_matrix(asset_width, asset_height, width, height, angle)
+    # remap needs the inverse mapping from destination pixels back to source
+    M_inv = cv2.invertAffineTransform(M).astype(np.float32)
+    xs, ys = np.meshgrid(
+        np.arange(width, dtype=np.float32), np.arange(height, dtype=np.float32)
+    )
+    map_x = M_inv[0, 0] * xs + M_inv[0, 1] * ys + M_inv[0, 2]
+    map_y = M_inv[1, 0] * xs + M_inv[1, 1] * ys + M_inv[1, 2]
+    return cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+
+
+@functools.lru_cache(maxsize=64)
+def _render_overlay_cached(asset_id, width, angle):
+    """
+    Resize and rotate an overlay asset for a quantized pose.
+
+    Args:
+        asset_id (int): The id() of a BGRA asset registered in _overlay_assets.
+        width (int): The target overlay width in pixels, quantized to
+            _OVERLAY_WIDTH_BIN.
+        angle (int): The rotation angle in whole degrees.
+
+    Returns:
+        overlay (numpy.ndarray): The resized and rotated BGRA overlay.
+        alpha_is_binary (bool): True when the overlay alpha contains only
+            0 and 255, so blending can be skipped in favor of a masked copy.
+    """
+    asset = _overlay_assets[asset_id]
+    aspect_ratio = asset.shape[0] / asset.shape[1]
+    height = int(width * aspect_ratio)
+
+    asset_height, asset_width = asset.shape[:2]
+
+    if _CUDA_AVAILABLE:
+        gpu_asset = _gpu_assets.get(asset_id)
+        if gpu_asset is None:
+            gpu_asset = cv2.cuda_GpuMat()
+            gpu_asset.upload(asset)
+            _gpu_assets[asset_id] = gpu_asset
+        M = _overlay_matrix(asset_width, asset_height, width, height, angle)
+        gpu_rotated = cv2.cuda.warpAffine(
+            gpu_asset,
+            M,
+            (width, height),
+            flags=cv2.INTER_LINEAR,
+            borderMode=cv2.BORDER_REPLICATE,
+        )
+        # Download once per cache miss; the blend still happens on the host
+        overlay = gpu_rotated.download()
+    else:
+        map1, map2 = _overlay_maps(asset_width, asset_height, width, height, angle)
+        overlay = cv2.remap(
+            asset,
+            map1,
+            map2,
+            interpolation=cv2.INTER_LINEAR,
+            borderMode=cv2.BORDER_REPLICATE,
+        )
+
+    # Classify the alpha channel once per rendered overlay so the per-frame
+    # blend does not have to re-scan it
+    alpha_channel = overlay[:, :, 3]
+    alpha_is_binary = not ((alpha_channel > 0) & (alpha_channel < 255)).any()
+    return overlay, alpha_is_binary
+
+
+def _render_overlay(asset, width, angle):
+    """
+    Return the asset resized and rotated for the given pose, using a small
+    LRU cache keyed by (asset, quantized width, whole-degree angle) so steady
+    head poses skip the per-frame resize and warpAffine entirely.
+
+    Args:
+        asset (numpy.ndarray): The BGRA overlay image.
+        width (float): The desired overlay width in pixels.
+        angle (float): The rotation angle in degrees.
+
+    Returns:
+        overlay (numpy.ndarray): The resized and rotated BGRA overlay.
+        alpha_is_binary (bool): True when the overlay alpha contains only
+            0 and 255.
+    """
+    width = max(_OVERLAY_WIDTH_BIN, int(width) // _OVERLAY_WIDTH_BIN * _OVERLAY_WIDTH_BIN)
+    _overlay_assets[id(asset)] = asset
+    return _render_overlay_cached(id(asset), width, int(round(angle)))
+
+
+def _blend_overlay(roi, overlay_roi, alpha_is_binary=False):
+    """
+    Alpha-blend a BGRA overlay onto a BGR region of interest in place.
+
+    Uses fixed-point uint16 arithmetic (src * a + dst * (255 - a)) >> 8 so
+    partially transparent overlay pixels blend smoothly instead of being
+    hard-copied on a binary alpha test.
+
+    Args:
+        roi (numpy.ndarray): The BGR region of the frame to blend into.
+        overlay_roi (numpy.ndarray): The BGRA overlay region of the same size.
+        alpha_is_binary (bool): True when the overlay alpha contains only
+            0 and 255, precomputed when the overlay was rendered.
+    """
+    # Overlays whose alpha is fully binary (only 0 or 255) need no blending
+    # at all; cv2.copyTo dispatches to a SIMD masked copy internally that
+    # moves whole pixels per element, with no Python-level mask allocation
+    if alpha_is_binary:
+        cv2.copyTo(overlay_roi[:, :, :3], overlay_roi[:, :, 3], roi)
+        return
+
+    if blend_bgra_over_bgr is not None:
+        blend_bgra_over_bgr(roi, overlay_roi)
+        return
+
+    height, width = overlay_roi.shape[:2]
+    alpha = _scratch.get("blend_alpha", (height, width, 1), np.uint16)
+    np.copyto(alpha, overlay_roi[:, :, 3:4])
+    inv_alpha = _scratch.get("blend_inv_alpha", (height, width, 1), np.uint16)
+    np.subtract(255, alpha, out=inv_alpha)
+
+    blended = _scratch.get("blend_acc", (height, width, 3), np.uint16)
+    weighted_dst = _scratch.get("blend_dst", (height, width, 3), np.uint16)
+    np.multiply(overlay_roi[:, :, :3], alpha, out=blended)
+    np.multiply(roi, inv_alpha, out=weighted_dst)
+    np.add(blended, weighted_dst, out=blended)
+    np.right_shift(blended, 8, out=blended)
+    np.copyto(roi, blended, casting="unsafe")
+
+
+def apply_blur_filter(frame, landmarks):
+    """
+    Apply a blur filter to the face using the detected landmarks.
+
+    Args:
+        frame (numpy.ndarray): The frame from the webcam capture.
+        landmarks (numpy.ndarray): An (n_faces, n_points, 2) int32 array of
+            facial landmarks.
+
+    Returns:
+        frame (numpy.ndarray): The frame with the face blurred.
+    """
+    if len(landmarks) == 0:
+        return frame
+
+    # Expand the face bounding box by the kernel radius so the blur has full
+    # support at the edges of the face region
+    kernel_radius = BLUR_KERNEL_SIZE[0] // 2
+
+    for face_landmarks in landmarks:
+        # Only the face-oval landmarks can lie on the hull, so skip the ~430
+        # interior points instead of feeding all 468 to convexHull
+        hull = cv2.convexHull(face_landmarks[FACE_OVAL_IDX])
+        x, y, w, h = cv2.boundingRect(hull)
+        x0 = max(0, x - kernel_radius)
+        y0 = max(0, y - kernel_radius)
+        x1 = min(frame.shape[1], x + w + kernel_radius)
+        y1 = min(frame.shape[0], y + h + kernel_radius)
+        if x1 <= x0 or y1 <= y0:
+            continue
+
+        # Blur only the face tile instead of the whole frame, then composite
+        # through a local mask shifted into tile coordinates
+        tile = frame[y0:y1, x0:x1]
+        tile_mask = _scratch.get("blur_mask", tile.shape[:2], np.uint8)
+        tile_mask.fill(0)
+        cv2.fillConvexPoly(tile_mask, hull - (x0, y0), 255)
+        # A downsample/upsample pyramid looks the same as a large Gaussian
+        # kernel for a privacy blur at a fraction of the cost
+        blurred_tile = cv2.UMat(tile) if _OPENCL_AVAILABLE else tile
+        for _ in range(BLUR_PYRAMID_LEVELS):
+            blurred_tile = cv2.pyrDown(blurred_tile)
+        for _ in range(BLUR_PYRAMID_LEVELS):
+            blurred_tile = cv2.pyrUp(blurred_tile)
+        if _OPENCL_AVAILABLE:
+            blurred_tile = blurred_tile.get()
+        if blurred_tile.shape[:2] != tile.shape[:2]:
+            # pyrUp rounds odd sizes up, so snap back to the exact tile size
+            blurred_tile = blurred_tile[: tile.shape[0], : tile.shape[1]]
+        np.copyto(tile, blurred_tile, where=tile_mask.astype(bool)[:, :, np.newaxis])
+
+    return frame
+
+
+def apply_sunglasses_filter(frame, landmarks, sunglasses=SUNGLASSES_IMG):
+    """
+    Apply a sunglasses filter to the face using the detected landmarks.
+
+    Args:
+        frame (numpy.ndarray): The frame from the webcam capture.
+        landmarks (numpy.ndarray): An (n_faces, n_points, 2) int32 array of
+            facial landmarks.
+        sunglasses (numpy.ndarray): The BGRA sunglasses image, decoded once
+            at import time.
+
+    Returns:
+        frame (numpy.ndarray): The frame with the sunglasses filter applied.
+    """
+    if len(landmarks) == 0:
+        return frame
+
+    if sunglasses is None:
+        print(f"Error: Unable to load sunglasses image from {SUNGLASSES_IMAGE_PATH}")
+        return frame
+
+    for face_landmarks in landmarks:
+        # Get the coordinates for the eyes
+        left_eye = face_landmarks[33]  # Left eye corner
+        right_eye = face_landmarks[263]  # Right eye corner
+
+        # Calculate the width and height of the sunglasses
+        eye_width = int(np.linalg.norm(right_eye - left_eye))
+        sunglasses_width = int(
+            eye_width * 2.2
+        )  # Adjust the multiplier for a better fit
+
+        # Calculate the angle between the eyes (invert the sign for correct direction)
+        eye_delta_x = right_eye[0] - left_eye[0]
+        eye_delta_y = right_eye[1] - left_eye[1]
+        angle = -np.degrees(np.arctan2(eye_delta_y, eye_delta_x))  # Inverted sign
+
+        # Resize and rotate the sunglasses image (cached across frames)
+        rotated_sunglasses, alpha_is_binary = _render_overlay(
+            sunglasses, sunglasses_width, angle
+        )
+        sunglasses_height, sunglasses_width = rotated_sunglasses.shape[:2]
+
+        # Calculate the position to overlay the sunglasses
+        center = face_landmarks[[33, 263]].mean(axis=0).astype(np.int32)
+        top_left = (
+            int(center[0] - sunglasses_width / 2),
+            int(center[1] - sunglasses_height / 2),
+        )
+
+        # Clamp the coordinates to the frame bounds in both directions; faces
+        # partially outside the frame can push the overlay box fully past an
+        # edge, where one-sided clamping would produce negative slice indices
+        top_left_y = min(frame.shape[0], max(0, top_left[1]))
+        bottom_right_y = max(0, min(frame.shape[0], top_left[1] + sunglasses_height))
+        top_left_x = min(frame.shape[1], max(0, top_left[0]))
+        bottom_right_x = max(0, min(frame.shape[1], top_left[0] + sunglasses_width))
+        if bottom_right_y <= top_left_y or bottom_right_x <= top_left_x:
+            continue
+
+        # Adjust the region of interest (ROI) in the frame
+        roi = frame[top_left_y:bottom_right_y, top_left_x:bottom_right_x]
+        sunglasses_roi = rotated_sunglasses[
+            top_left_y - top_left[1] : bottom_right_y - top_left[1],
+            top_left_x - top_left[0] : bottom_right_x - top_left[0],
+        ]
+        if roi.shape[:2] != sunglasses_roi.shape[:2]:
+            continue
+
+        # Blend the sunglasses onto the frame using the alpha channel
+        _blend_overlay(roi, sunglasses_roi, alpha_is_binary)
+
+    return frame
+
+
+def apply_mustache_filter(frame, landmarks, mustache=MUSTACHE_IMG):
+    """
+    Apply a mustache filter to the face using the detected landmarks.
+
+    Args:
+        frame (numpy.ndarray): The frame from the webcam capture.
+        landmarks (numpy.ndarray): An (n_faces, n_points, 2) int32 array of
+            facial landmarks.
+        mustache (numpy.ndarray): The BGRA mustache image, decoded once at
+            import time.
+
+    Returns:
+        frame (numpy.ndarray): The frame with the mustache filter applied.
+    """
+    if len(landmarks) == 0:
+        return frame
+
+    if mustache is None:
+        print(f"Error: Unable to load mustache image from {MUSTACHE_IMAGE_PATH}")
+        return frame
+
+    for face_landmarks in landmarks:
+        # Get the coordinates for the nose and upper lip
+        nose_tip = face_landmarks[1]  # Nose tip
+        left_mouth_corner = face_landmarks[61]  # Left mouth corner
+        right_mouth_corner = face_landmarks[291]  # Right mouth corner
+
+        # Calculate the width and height of the mustache
+        mouth_width = int(np.linalg.norm(right_mouth_corner - left_mouth_corner))
+        mustache_width = int(
+            mouth_width * 1.5
+        )  # Adjust the multiplier for a better fit
+
+        # Calculate the angle between the mouth corners
+        mouth_delta_x = right_mouth_corner[0] - left_mouth_corner[0]
+        mouth_delta_y = right_mouth_corner[1] - left_mouth_corner[1]
+        angle = -np.degrees(np.arctan2(mouth_delta_y, mouth_delta_x))
+
+        # Resize and rotate the mustache image (cached across frames)
+        rotated_mustache, alpha_is_binary = _render_overlay(
+            mustache, mustache_width, angle
+        )
+        mustache_height, mustache_width = rotated_mustache.shape[:2]
+
+        # Calculate the position to overlay the mustache
+        center = face_landmarks[[1, 61, 291]].mean(axis=0).astype(np.int32)
+        top_left = (
+            int(center[0] - mustache_width / 2),
+            int(
+                nose_tip[1] - mustache_height * 0.2
+            ),  # Adjust vertical position to move the mustache up
+        )
+
+        # Clamp the coordinates to the frame bounds in both directions; faces
+        # partially outside the frame can push the overlay box fully past an
+        # edge, where one-sided clamping would produce negative slice indices
+        top_left_y = min(frame.shape[0], max(0, top_left[1]))
+        bottom_right_y = max(0, min(frame.shape[0], top_left[1] + mustache_height))
+        top_left_x = min(frame.shape[1], max(0, top_left[0]))
+        bottom_right_x = max(0, min(frame.shape[1], top_left[0] + mustache_width))
+        if bottom_right_y <= top_left_y or bottom_right_x <= top_left_x:
+            continue
+
+        # Adjust the region of interest (ROI) in the frame
+        roi = frame[top_left_y:bottom_right_y, top_left_x:bottom_right_x]
+        mustache_roi = rotated_mustache[
+            top_left_y - top_left[1] : bottom_right_y - top_left[1],
+            top_left_x - top_left[0] : bottom_right_x - top_left[0],
+        ]
+        if roi.shape[:2] != mustache_roi.shape[:2]:
+            continue
+
+        # Blend the mustache onto the frame using the alpha channel
+        _blend_overlay(roi, mustache_roi, alpha_is_binary)
+
+    return frame
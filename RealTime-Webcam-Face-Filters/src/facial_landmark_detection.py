@@ -1,5 +1,6 @@
 import cv2
 import mediapipe as mp
+import numpy as np
 from src.webcam_constants import FACIAL_LANDMARK_WINDOW_NAME
 
 # Initialize MediaPipe Face Mesh
@@ -15,21 +16,24 @@ def detect_facial_landmarks(frame):
         frame (numpy.ndarray): The frame from the webcam capture.
 
     Returns:
-        landmarks (list): A list of facial landmarks.
+        landmarks (numpy.ndarray): An (n_faces, n_points, 2) int32 array of
+            pixel coordinates; empty when no face is detected.
     """
     rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
     results = face_mesh.process(rgb_frame)
 
-    landmarks = []
-    if results.multi_face_landmarks:
-        for face_landmarks in results.multi_face_landmarks:
-            landmarks.append(
-                [
-                    (int(landmark.x * frame.shape[1]), int(landmark.y * frame.shape[0]))
-                    for landmark in face_landmarks.landmark
-                ]
-            )
-    return landmarks
+    if not results.multi_face_landmarks:
+        return np.empty((0, 0, 2), dtype=np.int32)
+
+    faces = np.array(
+        [
+            [(landmark.x, landmark.y) for landmark in face_landmarks.landmark]
+            for face_landmarks in results.multi_face_landmarks
+        ],
+        dtype=np.float32,
+    )
+    faces *= (frame.shape[1], frame.shape[0])
+    return faces.astype(np.int32)
 
 
 def draw_facial_landmarks(frame, landmarks):
@@ -38,12 +42,13 @@ def draw_facial_landmarks(frame, landmarks):
 
     Args:
         frame (numpy.ndarray): The frame from the webcam capture.
-        landmarks (list): A list of facial landmarks.
+        landmarks (numpy.ndarray): An (n_faces, n_points, 2) int32 array of
+            facial landmarks.
 
     Returns:
         frame (numpy.ndarray): The frame with landmarks drawn.
     """
     for face_landmarks in landmarks:
         for x, y in face_landmarks:
-            cv2.circle(frame, (x, y), 1, (0, 255, 0), -1)
+            cv2.circle(frame, (int(x), int(y)), 1, (0, 255, 0), -1)
     return frame
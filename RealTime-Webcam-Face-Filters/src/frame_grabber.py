@@ -0,0 +1,78 @@
+import threading
+
+import cv2
+
+
+class FrameGrabber(threading.Thread):
+    """
+    Background thread that owns the webcam and always holds the latest frame.
+
+    Decouples camera I/O from detection and rendering: the grabber keeps
+    calling VideoCapture.read() on its own thread and overwrites a single
+    latest-frame slot (drop-oldest), so the processing loop never blocks on
+    the camera and never works on a stale backlog of frames.
+    """
+
+    def __init__(self, webcam_index):
+        """
+        Open the webcam and prepare the shared latest-frame slot.
+
+        Args:
+            webcam_index (int): The index of the webcam to capture from.
+        """
+        super().__init__(daemon=True)
+        self._capture = cv2.VideoCapture(webcam_index)
+        self._condition = threading.Condition()
+        self._frame = None
+        self._running = True
+
+    def is_opened(self):
+        """
+        Return whether the underlying webcam was opened successfully.
+
+        Returns:
+            opened (bool): True if the webcam is available.
+        """
+        return self._capture.isOpened()
+
+    def run(self):
+        """
+        Continuously read frames from the webcam into the latest-frame slot.
+        """
+        while self._running:
+            ret, frame = self._capture.read()
+            with self._condition:
+                if not ret:
+                    self._running = False
+                else:
+                    self._frame = frame
+                self._condition.notify_all()
+
+    def read(self):
+        """
+        Wait for and return the most recent frame from the webcam.
+
+        Mirrors the (ret, frame) contract of VideoCapture.read so the capture
+        loop can consume the grabber as a drop-in replacement.
+
+        Returns:
+            ret (bool): True if a frame was read successfully.
+            frame (numpy.ndarray): The latest captured frame, or None.
+        """
+        with self._condition:
+            while self._frame is None and self._running:
+                self._condition.wait()
+            frame = self._frame
+            self._frame = None
+            return frame is not None, frame
+
+    def stop(self):
+        """
+        Stop the capture thread and release the webcam.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self.is_alive():
+            self.join()
+        self._capture.release()
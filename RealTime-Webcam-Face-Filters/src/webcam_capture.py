@@ -1,92 +1,203 @@
-import cv2
-from src.webcam_constants import (
-    WEBCAM_INDEX,
-    EXIT_KEY,
-    WINDOW_NAME,
-    FRAME_WAIT_KEY,
-    FILTER_NONE_KEY,
-    FILTER_LANDMARK_KEY,
-    FILTER_BLUR_KEY,
-    FILTER_SUNGLASSES_KEY,
-    FILTER_MUSTACHE_KEY,
-    MENU_TEXT,
-    MENU_POSITION,
-    MENU_FONT,
-    MENU_FONT_SCALE,
-    MENU_FONT_THICKNESS,
-    MENU_COLOR,
-)
-
-from src.facial_landmark_detection import detect_facial_landmarks, draw_facial_landmarks
-from src.face_filters import (
-    apply_blur_filter,
-    apply_sunglasses_filter,
-    apply_mustache_filter,
-)
-
-
-def open_webcam_with_filter_switching():
-    """
-    Opens the webcam and starts capturing video frames with real-time filter switching.
-
-    The function captures video from the default webcam, allows the user to switch
-    between plain, facial landmark detection, blur filter, sunglasses filter, and mustache filter in real-time,
-    and exits when the specified exit key is pressed. An on-screen menu is displayed to guide the user.
-    """
-    video_capture = cv2.VideoCapture(WEBCAM_INDEX)
-    if not video_capture.isOpened():
-        print(f"Error: Unable to access the webcam at index {WEBCAM_INDEX}")
-        return
-
-    current_filter = FILTER_NONE_KEY
-
-    while True:
-        ret, frame = video_capture.read()
-        if not ret:
-            print("Error: Unable to read frame from webcam")
-            break
-
-        # Apply the selected filter
-        if current_filter == FILTER_LANDMARK_KEY:
-            landmarks = detect_facial_landmarks(frame)
-            frame = draw_facial_landmarks(frame, landmarks)
-        elif current_filter == FILTER_BLUR_KEY:
-            landmarks = detect_facial_landmarks(frame)
-            frame = apply_blur_filter(frame, landmarks)
-        elif current_filter == FILTER_SUNGLASSES_KEY:
-            landmarks = detect_facial_landmarks(frame)
-            frame = apply_sunglasses_filter(frame, landmarks)
-        elif current_filter == FILTER_MUSTACHE_KEY:
-            landmarks = detect_facial_landmarks(frame)
-            frame = apply_mustache_filter(frame, landmarks)
-
-        # Draw the on-screen menu
-        for i, line in enumerate(MENU_TEXT.split("\n")):
-            cv2.putText(
-                frame,
-                line,
-                (MENU_POSITION[0], MENU_POSITION[1] + i * 20),
-                MENU_FONT,
-                MENU_FONT_SCALE,
-                MENU_COLOR,
-                MENU_FONT_THICKNESS,
-            )
-
-        cv2.imshow(WINDOW_NAME, frame)
-
-        key = cv2.waitKey(FRAME_WAIT_KEY) & 0xFF
-        if key == ord(EXIT_KEY):
-            break
-        elif key == ord(FILTER_NONE_KEY):
-            current_filter = FILTER_NONE_KEY
-        elif key == ord(FILTER_LANDMARK_KEY):
-            current_filter = FILTER_LANDMARK_KEY
-        elif key == ord(FILTER_BLUR_KEY):
-            current_filter = FILTER_BLUR_KEY
-        elif key == ord(FILTER_SUNGLASSES_KEY):
-            current_filter = FILTER_SUNGLASSES_KEY
-        elif key == ord(FILTER_MUSTACHE_KEY):
-            current_filter = FILTER_MUSTACHE_KEY
-
-    video_capture.release()
-    cv2.destroyAllWindows()
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+from src.webcam_constants import (
+    WEBCAM_INDEX,
+    EXIT_KEY,
+    WINDOW_NAME,
+    FRAME_WAIT_KEY,
+    FILTER_NONE_KEY,
+    FILTER_LANDMARK_KEY,
+    FILTER_BLUR_KEY,
+    FILTER_SUNGLASSES_KEY,
+    FILTER_MUSTACHE_KEY,
+    DETECT_DOWNSCALE,
+    LANDMARK_DIFF_SIZE,
+    LANDMARK_DIFF_THRESHOLD,
+    LANDMARK_REFRESH_INTERVAL,
+    MENU_LINES,
+    MENU_POSITION,
+    MENU_FONT,
+    MENU_FONT_SCALE,
+    MENU_FONT_THICKNESS,
+    MENU_COLOR,
+)
+
+from src.facial_landmark_detection import detect_facial_landmarks, draw_facial_landmarks
+from src.frame_grabber import FrameGrabber
+from src.face_filters import (
+    apply_blur_filter,
+    apply_sunglasses_filter,
+    apply_mustache_filter,
+)
+
+
+def _detect_landmarks_downscaled(frame):
+    """
+    Detect facial landmarks on a downscaled copy of the frame.
+
+    Runs the detector at 1/DETECT_DOWNSCALE resolution, which is roughly
+    DETECT_DOWNSCALE^2 times faster, and scales the landmark coordinates back
+    up so the filters still operate on the full-resolution frame.
+
+    Args:
+        frame (numpy.ndarray): The full-resolution frame from the webcam.
+
+    Returns:
+        landmarks (numpy.ndarray): An (n_faces, n_points, 2) int32 array of
+            facial landmarks in full-frame coordinates.
+    """
+    if DETECT_DOWNSCALE <= 1:
+        return detect_facial_landmarks(frame)
+
+    small_frame = cv2.resize(
+        frame,
+        None,
+        fx=1 / DETECT_DOWNSCALE,
+        fy=1 / DETECT_DOWNSCALE,
+        interpolation=cv2.INTER_AREA,
+    )
+    return detect_facial_landmarks(small_frame) * DETECT_DOWNSCALE
+
+
+# Dispatch tables built once at import: filter handlers share the
+# (frame, landmarks) signature, and key codes map straight to filter keys so
+# the frame loop does a dict lookup instead of an if/elif ladder
+_FILTER_HANDLERS = {
+    FILTER_LANDMARK_KEY: draw_facial_landmarks,
+    FILTER_BLUR_KEY: apply_blur_filter,
+    FILTER_SUNGLASSES_KEY: apply_sunglasses_filter,
+    FILTER_MUSTACHE_KEY: apply_mustache_filter,
+}
+_KEY_TO_FILTER = {
+    ord(filter_key): filter_key
+    for filter_key in (
+        FILTER_NONE_KEY,
+        FILTER_LANDMARK_KEY,
+        FILTER_BLUR_KEY,
+        FILTER_SUNGLASSES_KEY,
+        FILTER_MUSTACHE_KEY,
+    )
+}
+_EXIT_KEY_CODE = ord(EXIT_KEY)
+
+# State for the inter-frame stability check; only touched from the single
+# detection worker thread, so no locking is needed
+_prev_thumbnail = None
+_cached_landmarks = None
+_frames_since_detection = 0
+
+
+def _detect_landmarks_cached(frame):
+    """
+    Detect facial landmarks, reusing the previous result on stable frames.
+
+    Compares a small grayscale thumbnail of the frame against the previous
+    one with cv2.absdiff; when the mean difference is below
+    LANDMARK_DIFF_THRESHOLD the cached landmarks are returned without running
+    the detector. A fresh detection is forced at least every
+    LANDMARK_REFRESH_INTERVAL frames so drift cannot accumulate.
+
+    Args:
+        frame (numpy.ndarray): The full-resolution frame from the webcam.
+
+    Returns:
+        landmarks (numpy.ndarray): An (n_faces, n_points, 2) int32 array of
+            facial landmarks in full-frame coordinates.
+    """
+    global _prev_thumbnail, _cached_landmarks, _frames_since_detection
+
+    gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    thumbnail = cv2.resize(
+        gray_frame, LANDMARK_DIFF_SIZE, interpolation=cv2.INTER_AREA
+    )
+    stable = (
+        _prev_thumbnail is not None
+        and _cached_landmarks is not None
+        and _frames_since_detection < LANDMARK_REFRESH_INTERVAL
+        and cv2.absdiff(thumbnail, _prev_thumbnail).mean() < LANDMARK_DIFF_THRESHOLD
+    )
+    _prev_thumbnail = thumbnail
+
+    if stable:
+        _frames_since_detection += 1
+        return _cached_landmarks
+
+    _cached_landmarks = _detect_landmarks_downscaled(frame)
+    _frames_since_detection = 0
+    return _cached_landmarks
+
+
+def open_webcam_with_filter_switching():
+    """
+    Opens the webcam and starts capturing video frames with real-time filter switching.
+
+    The function captures video from the default webcam, allows the user to switch
+    between plain, facial landmark detection, blur filter, sunglasses filter, and mustache filter in real-time,
+    and exits when the specified exit key is pressed. An on-screen menu is displayed to guide the user.
+    """
+    frame_grabber = FrameGrabber(WEBCAM_INDEX)
+    if not frame_grabber.is_opened():
+        print(f"Error: Unable to access the webcam at index {WEBCAM_INDEX}")
+        return
+    frame_grabber.start()
+
+    current_filter = FILTER_NONE_KEY
+
+    # Landmark detection for the newest frame runs on this worker while the
+    # previous frame is rendered and displayed, trading one frame of pose
+    # latency for overlapping detection with rendering
+    detection_executor = ThreadPoolExecutor(max_workers=1)
+    pending_frame = None
+    pending_detection = None
+
+    while True:
+        ret, frame = frame_grabber.read()
+        if not ret:
+            print("Error: Unable to read frame from webcam")
+            break
+
+        # Apply the selected filter, pipelining detection one frame ahead
+        captured_frame = frame
+        filter_handler = _FILTER_HANDLERS.get(current_filter)
+        if filter_handler is None:
+            pending_frame = None
+            pending_detection = None
+        else:
+            detection = detection_executor.submit(
+                _detect_landmarks_cached, captured_frame
+            )
+            if pending_detection is None:
+                # First filtered frame: show it unfiltered while its detection
+                # runs, and keep a pristine copy for the next iteration since
+                # the menu is about to be stamped on the displayed frame
+                pending_frame = captured_frame.copy()
+            else:
+                frame = pending_frame
+                landmarks = pending_detection.result()
+                frame = filter_handler(frame, landmarks)
+                pending_frame = captured_frame
+            pending_detection = detection
+
+        # Draw the on-screen menu
+        for i, line in enumerate(MENU_LINES):
+            cv2.putText(
+                frame,
+                line,
+                (MENU_POSITION[0], MENU_POSITION[1] + i * 20),
+                MENU_FONT,
+                MENU_FONT_SCALE,
+                MENU_COLOR,
+                MENU_FONT_THICKNESS,
+            )
+
+        cv2.imshow(WINDOW_NAME, frame)
+
+        key = cv2.waitKey(FRAME_WAIT_KEY) & 0xFF
+        if key == _EXIT_KEY_CODE:
+            break
+        current_filter = _KEY_TO_FILTER.get(key, current_filter)
+
+    detection_executor.shutdown()
+    frame_grabber.stop()
+    cv2.destroyAllWindows()
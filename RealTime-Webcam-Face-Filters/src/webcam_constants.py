@@ -8,9 +8,22 @@ FRAME_WAIT_KEY = 1  # Delay in milliseconds for each frame
 
 # Constants for facial landmark detection
 FACIAL_LANDMARK_WINDOW_NAME = "Facial Landmark Detection"
+DETECT_DOWNSCALE = 2  # Detection runs at 1/N resolution; 1 disables downscaling
+LANDMARK_DIFF_SIZE = (80, 60)  # Thumbnail size for the inter-frame diff check
+LANDMARK_DIFF_THRESHOLD = 3.0  # Mean absdiff below which landmarks are reused
+LANDMARK_REFRESH_INTERVAL = 15  # Redetect at least every N frames regardless
+
+# MediaPipe Face Mesh FACE_OVAL landmark indices, ordered around the face
+# silhouette; only these can lie on the convex hull of the face
+FACE_OVAL_IDX = [
+    10, 338, 297, 332, 284, 251, 389, 356, 454, 323, 361, 288,
+    397, 365, 379, 378, 400, 377, 152, 148, 176, 149, 150, 136,
+    172, 58, 132, 93, 234, 127, 162, 21, 54, 103, 67, 109,
+]
 
 # Constants for face filters
 BLUR_KERNEL_SIZE = (31, 31)  # Kernel size for the blur filter
+BLUR_PYRAMID_LEVELS = 2  # pyrDown/pyrUp levels used for the privacy blur
 
 # Constants for filter selection keys
 FILTER_NONE_KEY = "0"
@@ -23,6 +36,11 @@ FILTER_MUSTACHE_KEY = "4"
 SUNGLASSES_IMAGE_PATH = "assets/sunglasses.png"
 MUSTACHE_IMAGE_PATH = "assets/mustache.png"
 
+# Overlay assets decoded once at import so the filters do not re-read and
+# re-decode the PNG files on every frame
+SUNGLASSES_IMG = cv2.imread(SUNGLASSES_IMAGE_PATH, cv2.IMREAD_UNCHANGED)
+MUSTACHE_IMG = cv2.imread(MUSTACHE_IMAGE_PATH, cv2.IMREAD_UNCHANGED)
+
 # Constants for on-screen menu
 MENU_TEXT = (
     "Press '0' for no filter\n"
@@ -32,6 +50,7 @@ MENU_TEXT = (
     "Press '4' for mustache filter\n"
     "Press 'q' to exit"
 )
+MENU_LINES = MENU_TEXT.split("\n")  # Menu lines split once for the frame loop
 MENU_POSITION = (10, 30)  # Coordinates for the menu text
 MENU_FONT = cv2.FONT_HERSHEY_SIMPLEX
 MENU_FONT_SCALE = 0.4